@@ -1,100 +1,189 @@
+import numba
+import numexpr as ne
 import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Optional, Tuple
 from prop_designer.types.prop import Propeller, BladeSection
 
-def calculate_bet(prop: Propeller, rpm: float, free_stream_velocity: float) -> Tuple[float, float, pd.DataFrame]:
+# Dynamic pressure factor for sea-level air density (kg/m^3)
+_HALF_RHO = 0.5 * 1.225
+_RPM_TO_OMEGA = 2.0 * np.pi / 60.0
+_RAD2DEG = 180.0 / np.pi
+
+@numba.njit(cache=True, fastmath=True)
+def _lookup(lut: np.ndarray, alpha_min: float, inv_dalpha: float, alpha_deg: float) -> float:
+    """Linearly interpolate a coefficient from a uniform-grid lookup table
+
+    Angles outside the table are clamped to its end values, as with np.interp.
+    """
+    idx_f = (alpha_deg - alpha_min) * inv_dalpha
+    if idx_f <= 0.0:
+        return lut[0]
+    if idx_f >= lut.size - 1:
+        return lut[lut.size - 1]
+    idx = int(idx_f)
+    t = idx_f - idx
+    return lut[idx] * (1.0 - t) + lut[idx + 1] * t
+
+def _lookup_weights(alpha_min: float, inv_dalpha: float, lut_size: int, alpha_deg: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    "Grid indices and blend weights for an array of angles, shared by every table on the same grid"
+    t = alpha_deg - alpha_min
+    t *= inv_dalpha
+    np.clip(t, 0, lut_size - 1, out=t)
+    idx = t.astype(np.intp)
+    np.minimum(idx, lut_size - 2, out=idx)
+    t -= idx
+    return idx, t
+
+def _lookup_array(lut: np.ndarray, idx: np.ndarray, t: np.ndarray) -> np.ndarray:
+    "Vectorized version of _lookup using weights from _lookup_weights"
+    lower = lut[idx]
+    out = lut[idx + 1]
+    out -= lower
+    out *= t
+    out += lower
+    return out
+
+@numba.njit(cache=True, fastmath=True)
+def _section_forces(radius: float, chord: float, twist: float,
+                    alpha_min: float, inv_dalpha: float, cl_lut: np.ndarray, cd_lut: np.ndarray,
+                    omega: float, free_stream_velocity: float, section_width: float):
+    """Blade element results for one section at one operating point
+
+    Returns:
+        tuple: (alpha_deg, phi, velocity, cl, cd, dL, dD, dT, dQ)
+    """
+    # Tangential velocity at this radius
+    tangential_velocity = omega * radius
+
+    # Calculate velocity triangle
+    velocity = np.sqrt(tangential_velocity**2 + free_stream_velocity**2)
+    phi = np.arctan2(free_stream_velocity, tangential_velocity)
+
+    # Calculate effective angle of attack
+    alpha_deg = twist - phi * _RAD2DEG
+
+    # Interpolate coefficients
+    cl = _lookup(cl_lut, alpha_min, inv_dalpha, alpha_deg)
+    cd = _lookup(cd_lut, alpha_min, inv_dalpha, alpha_deg)
+
+    # Calculate sectional forces
+    q = _HALF_RHO * velocity**2
+    dL = cl * q * chord * section_width
+    dD = cd * q * chord * section_width
+
+    # Inflow angle components straight from the velocity triangle
+    if velocity > 0.0:
+        cos_phi = tangential_velocity / velocity
+        sin_phi = free_stream_velocity / velocity
+    else:
+        cos_phi = 1.0
+        sin_phi = 0.0
+
+    # Transform forces to thrust and torque
+    dT = dL * cos_phi - dD * sin_phi
+    dQ = (dL * sin_phi + dD * cos_phi) * radius
+
+    return alpha_deg, phi, velocity, cl, cd, dL, dD, dT, dQ
+
+@numba.njit(cache=True, fastmath=True)
+def _bet_kernel(radii: np.ndarray, chords: np.ndarray, twists: np.ndarray,
+                alpha_min: float, inv_dalpha: float, cl_lut: np.ndarray, cd_lut: np.ndarray,
+                omega: float, free_stream_velocity: float, section_width: float):
+    """Per-section blade element results for a single operating point
+
+    Returns:
+        tuple: (alpha_deg, phi, velocity, cl, cd, dL, dD, dT, dQ) arrays, one entry per section
+    """
+    n = radii.size
+    alpha_deg = np.empty(n)
+    phi = np.empty(n)
+    velocity = np.empty(n)
+    cl = np.empty(n)
+    cd = np.empty(n)
+    dL = np.empty(n)
+    dD = np.empty(n)
+    dT = np.empty(n)
+    dQ = np.empty(n)
+
+    for i in range(n):
+        (alpha_deg[i], phi[i], velocity[i], cl[i], cd[i],
+         dL[i], dD[i], dT[i], dQ[i]) = _section_forces(
+            radii[i], chords[i], twists[i], alpha_min, inv_dalpha, cl_lut, cd_lut,
+            omega, free_stream_velocity, section_width)
+
+    return alpha_deg, phi, velocity, cl, cd, dL, dD, dT, dQ
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def bet_sweep(radii: np.ndarray, chords: np.ndarray, twists: np.ndarray,
+              alpha_min: float, inv_dalpha: float, cl_lut: np.ndarray, cd_lut: np.ndarray,
+              section_width: float, num_blades: int,
+              rpms: np.ndarray, free_stream_velocities: np.ndarray,
+              out_T: np.ndarray, out_Q: np.ndarray):
+    """Thrust and torque totals for many operating points, run in parallel across points
+
+    Operates on the raw Propeller arrays so it can be called from other compiled code.
+    Results are written into out_T and out_Q, which must be the same size as rpms.
+    """
+    for k in numba.prange(rpms.size):
+        omega = rpms[k] * _RPM_TO_OMEGA
+        thrust = 0.0
+        torque = 0.0
+        for i in range(radii.size):
+            dT, dQ = _section_forces(
+                radii[i], chords[i], twists[i], alpha_min, inv_dalpha, cl_lut, cd_lut,
+                omega, free_stream_velocities[k], section_width)[7:]
+            thrust += dT
+            torque += dQ
+        out_T[k] = thrust * num_blades
+        out_Q[k] = torque * num_blades
+
+def calculate_bet(prop: Propeller, rpm: float, free_stream_velocity: float, return_frame: bool = True) -> Tuple[float, float, Optional[pd.DataFrame]]:
     """Calculate thrust and torque using Blade Element Theory
     
     Args:
         prop (Propeller): Propeller object
         rpm (float): Propeller rotational speed (RPM)
         free_stream_velocity (float): Incoming airspeed (m/s)
+        return_frame (bool): Build the per-section results DataFrame. Pass False when only
+            the totals are needed, e.g. inside an optimizer loop.
         
     Returns:
-        tuple: (thrust_total, torque_total, section_results_df)
+        tuple: (thrust_total, torque_total, section_results_df), with section_results_df
+            None when return_frame is False
     """
-    # Initialize lists to store section data
-    section_data = {
-        'radius': [],
-        'r/R': [],
-        'alpha_deg': [],
-        'phi_deg': [],
-        'chord': [],
-        'twist': [],
-        'cl': [],
-        'cd': [],
-        'dL': [],
-        'dD': [],
-        'velocity': [],
-        'thrust': [],
-        'torque': []
-    }
-    
-    thrust_forces = []
-    torque_forces = []
-    
-    section_width = (prop.diameter / 2) / len(prop.sections)
-    omega = rpm * (2 * np.pi / 60)
-    
-    for blade in prop.sections:
-        # Tangential velocity at this radius
-        tangential_velocity = omega * blade.radius
-        
-        # Calculate velocity triangle
-        resultant_velocity = np.sqrt(tangential_velocity**2 + free_stream_velocity**2)
-        phi = np.arctan2(free_stream_velocity, tangential_velocity)
-        
-        # Calculate effective angle of attack
-        alpha = np.radians(blade.twist) - phi
-        alpha_deg = np.degrees(alpha)
-        
-        # Interpolate coefficients
-        try:
-            cl = np.interp(x=alpha_deg, xp=blade.cl_alpha[0], fp=blade.cl_alpha[1])
-        except ValueError as e:
-            print(f"Alpha {alpha_deg:.1f}° out of range for Cl interpolation: {e}")
-            cl = 0    
-
-        try:
-            cd = np.interp(x=alpha_deg, xp=blade.cd_alpha[0], fp=blade.cd_alpha[1])
-        except ValueError as e:
-            print(f"Alpha {alpha_deg:.1f}° out of range for Cd interpolation: {e}")
-            cd = 0    
-
-        # Calculate sectional forces
-        q = 0.5 * 1.225 * resultant_velocity**2
-        dL = cl * q * blade.chord * section_width
-        dD = cd * q * blade.chord * section_width
-        
-        # Transform forces to thrust and torque
-        dT = dL * np.cos(phi) - dD * np.sin(phi)
-        dQ = (dL * np.sin(phi) + dD * np.cos(phi)) * blade.radius
-        
-        # Store section data
-        section_data['radius'].append(blade.radius)
-        section_data['r/R'].append(blade.radius / (prop.diameter/2))
-        section_data['alpha_deg'].append(alpha_deg)
-        section_data['phi_deg'].append(np.degrees(phi))
-        section_data['chord'].append(blade.chord)
-        section_data['twist'].append(blade.twist)
-        section_data['cl'].append(cl)
-        section_data['cd'].append(cd)
-        section_data['dL'].append(dL)
-        section_data['dD'].append(dD)
-        section_data['velocity'].append(resultant_velocity)
-        section_data['thrust'].append(dT)
-        section_data['torque'].append(dQ)
-        
-        thrust_forces.append(dT)
-        torque_forces.append(dQ)
+    section_width = (prop.diameter / 2) / len(prop.radii)
+    omega = rpm * _RPM_TO_OMEGA
+
+    alpha_deg, phi, velocity, cl, cd, dL, dD, dT, dQ = _bet_kernel(
+        prop.radii, prop.chords, prop.twists,
+        prop.alpha_min, prop.inv_dalpha, prop.cl_lut, prop.cd_lut,
+        float(omega), float(free_stream_velocity), float(section_width))
 
     # Calculate totals
-    thrust_total = sum(thrust_forces) * prop.num_blades
-    torque_total = sum(torque_forces) * prop.num_blades
+    thrust_total = dT.sum() * prop.num_blades
+    torque_total = dQ.sum() * prop.num_blades
+
+    if not return_frame:
+        return thrust_total, torque_total, None
     
-    # Create DataFrame
-    df = pd.DataFrame(section_data)
+    # Create DataFrame. The kernel outputs are fresh arrays and can be shared, but the
+    # geometry columns are copied so editing the frame cannot change the propeller.
+    df = pd.DataFrame({
+        'radius': prop.radii.copy(),
+        'r/R': prop.radii / (prop.diameter/2),
+        'alpha_deg': alpha_deg,
+        'phi_deg': phi * _RAD2DEG,
+        'chord': prop.chords.copy(),
+        'twist': prop.twists.copy(),
+        'cl': cl,
+        'cd': cd,
+        'dL': dL,
+        'dD': dD,
+        'velocity': velocity,
+        'thrust': dT,
+        'torque': dQ
+    }, copy=False)
         
     # Add total values as attributes to the DataFrame
     df.attrs['thrust_total'] = thrust_total
@@ -102,4 +191,97 @@ def calculate_bet(prop: Propeller, rpm: float, free_stream_velocity: float) -> T
     df.attrs['rpm'] = rpm
     df.attrs['velocity'] = free_stream_velocity
 
-    return thrust_total, torque_total, df
\ No newline at end of file
+    # Coefficients are clamped outside the airfoil data, so record how many sections hit that
+    # in either the lift or the drag curve
+    (cl_first, cl_last), (cd_first, cd_last) = prop.cl_alpha_range, prop.cd_alpha_range
+    alpha_out = ((alpha_deg < cl_first) | (alpha_deg > cl_last)
+                 | (alpha_deg < cd_first) | (alpha_deg > cd_last))
+    df.attrs['alpha_out_of_range'] = int(alpha_out.sum())
+
+    return thrust_total, torque_total, df
+
+
+def calculate_bet_batch(prop: Propeller, rpm_array: np.ndarray, free_stream_velocity_array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate thrust and torque at many operating points using Blade Element Theory
+
+    All operating points are evaluated together as (operating point, section) arrays,
+    with the arithmetic fused by numexpr.
+    
+    Args:
+        prop (Propeller): Propeller object
+        rpm_array (np.ndarray): Propeller rotational speeds (RPM)
+        free_stream_velocity_array (np.ndarray): Incoming airspeeds (m/s), broadcast against rpm_array
+        
+    Returns:
+        tuple: (thrust_totals, torque_totals), one entry per operating point. Scalar inputs
+            give np.float64 scalars.
+    """
+    rpm_array, free_stream_velocity_array = np.broadcast_arrays(
+        np.asarray(rpm_array, dtype=float), np.asarray(free_stream_velocity_array, dtype=float))
+    shape = rpm_array.shape
+    rpm_array = rpm_array.reshape(-1, 1)
+    free_stream_velocity_array = free_stream_velocity_array.reshape(-1, 1)
+
+    radius = prop.radii[None, :]
+    section_width = (prop.diameter / 2) / len(prop.radii)
+    omega = rpm_array * _RPM_TO_OMEGA
+
+    # Velocity triangle for every (operating point, section) pair
+    variables = {
+        'V_t': omega * radius,
+        'V_inf': free_stream_velocity_array,
+        'twist': prop.twists[None, :],
+        'chord': prop.chords[None, :],
+        'r': radius,
+        'dr': section_width,
+        'half_rho': _HALF_RHO,
+        'rad2deg': _RAD2DEG,
+    }
+    variables['V'] = ne.evaluate("sqrt(V_t*V_t + V_inf*V_inf)", local_dict=variables)
+    alpha_deg = ne.evaluate("twist - arctan2(V_inf, V_t) * rad2deg", local_dict=variables)
+
+    # Interpolate coefficients
+    idx, t = _lookup_weights(prop.alpha_min, prop.inv_dalpha, prop.cl_lut.size, alpha_deg)
+    variables['cl'] = _lookup_array(prop.cl_lut, idx, t)
+    variables['cd'] = _lookup_array(prop.cd_lut, idx, t)
+
+    # Sectional forces projected onto thrust and torque. With cos(phi) = V_t/V and
+    # sin(phi) = V_inf/V, the dynamic pressure's V*V cancels one V, so no division is needed.
+    variables['scale'] = ne.evaluate("half_rho * V * chord * dr", local_dict=variables)
+    dT = ne.evaluate("scale * (cl*V_t - cd*V_inf)", local_dict=variables)
+    dQ = ne.evaluate("scale * (cl*V_inf + cd*V_t) * r", local_dict=variables)
+
+    # Indexing with () turns a 0-d result for scalar inputs into a scalar, like calculate_bet
+    thrust_totals = (dT.sum(axis=1) * prop.num_blades).reshape(shape)[()]
+    torque_totals = (dQ.sum(axis=1) * prop.num_blades).reshape(shape)[()]
+
+    return thrust_totals, torque_totals
+
+
+def calculate_bet_sweep(prop: Propeller, rpm_array: np.ndarray, free_stream_velocity_array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate thrust and torque at many operating points in parallel using bet_sweep
+    
+    Args:
+        prop (Propeller): Propeller object
+        rpm_array (np.ndarray): Propeller rotational speeds (RPM)
+        free_stream_velocity_array (np.ndarray): Incoming airspeeds (m/s), broadcast against rpm_array
+        
+    Returns:
+        tuple: (thrust_totals, torque_totals), one entry per operating point. Scalar inputs
+            give np.float64 scalars.
+    """
+    rpm_array, free_stream_velocity_array = np.broadcast_arrays(
+        np.asarray(rpm_array, dtype=float), np.asarray(free_stream_velocity_array, dtype=float))
+    shape = rpm_array.shape
+    rpms = np.ascontiguousarray(rpm_array).ravel()
+    free_stream_velocities = np.ascontiguousarray(free_stream_velocity_array).ravel()
+
+    thrust_totals = np.empty(rpms.size)
+    torque_totals = np.empty(rpms.size)
+    bet_sweep(prop.radii, prop.chords, prop.twists,
+              prop.alpha_min, prop.inv_dalpha, prop.cl_lut, prop.cd_lut,
+              (prop.diameter / 2) / len(prop.radii), prop.num_blades,
+              rpms, free_stream_velocities, thrust_totals, torque_totals)
+
+    # Indexing with () turns a 0-d result for scalar inputs into a scalar, like calculate_bet
+    return thrust_totals.reshape(shape)[()], torque_totals.reshape(shape)[()]
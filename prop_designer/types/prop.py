@@ -1,25 +1,159 @@
-from pydantic import BaseModel, Field
-from typing import List, Callable, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import List, Callable, Optional, Tuple
 import numpy as np
 
+# Largest uniform alpha grid used for coefficient lookups
+AIRFOIL_LUT_MAX_SIZE = 4096
+
+# Resolution used to find the common spacing of the airfoil data (degree)
+_ALPHA_RESOLUTION = 1e-6
+
+def _lut_size(alpha: np.ndarray) -> int:
+    """Number of points in a uniform grid over alpha whose spacing evenly divides the data spacing
+
+    With every data point on a grid node, linear lookups on the grid match np.interp on the data.
+    Data with no common spacing that fits in AIRFOIL_LUT_MAX_SIZE points falls back to that size,
+    and lookups are then only approximate: each breakpoint between grid nodes adds up to
+    spacing/4 times its change in slope of error (about 6e-6 for breakpoints every 1/3 degree).
+    alpha must hold at least two distinct angles.
+    """
+    ticks = np.unique(np.round((alpha - alpha[0]) / _ALPHA_RESOLUTION).astype(np.int64))
+    step = np.gcd.reduce(np.diff(ticks))
+    num_points = ticks[-1] // step + 1
+    return int(min(num_points, AIRFOIL_LUT_MAX_SIZE))
+
 class BladeSection(BaseModel):
     "A single blade section of a propeller"
+    # Frozen so the geometry arrays cached on Propeller cannot go stale
+    model_config = ConfigDict(frozen=True)
+
     # Geometric properties
     radius: float = Field(..., description="Radial position from the hub center (m)")
     chord: float = Field(..., description="Chord length (m)")
     twist: float = Field(..., description="Geometric twist (degree)")
-    
-    # Aerodynamic properties - these come from airfoil choice
-    cl_alpha: Tuple[List[float], List[float]] = Field(..., description="Lift curve slope (degree)")
-    cd_alpha: Tuple[List[float], List[float]] = Field(..., description="Drag curve slope (degree)")
 
 class Propeller(BaseModel):
     "A complete propeller"
+    # Validate assignments so replaced sections and curves are stored as tuples too
+    model_config = ConfigDict(validate_assignment=True)
+
     num_blades: int = Field(..., description="Number of blades")
     diameter: float = Field(..., description="Propeller diameter (m)")
     hub_radius: float = Field(..., description="Hub radius (m)")
-    sections: List[BladeSection] = Field(..., description="List of blade sections")
+    sections: Tuple[BladeSection, ...] = Field(..., description="Blade sections, hub to tip")
+
+    # Aerodynamic properties - these come from airfoil choice and are shared by all sections
+    cl_alpha: Tuple[Tuple[float, ...], Tuple[float, ...]] = Field(..., description="Lift curve slope (degree)")
+    cd_alpha: Tuple[Tuple[float, ...], Tuple[float, ...]] = Field(..., description="Drag curve slope (degree)")
+
+    # Derived arrays, rebuilt whenever the sections or airfoil curves they come from are replaced.
+    # The sources are immutable tuples and frozen models, so replacing them is the only way they change.
+    _section_cache: Optional[tuple] = PrivateAttr(None)
+    _airfoil_cache: Optional[tuple] = PrivateAttr(None)
+
+    def _set_section_arrays(self, radii: np.ndarray, chords: np.ndarray, twists: np.ndarray) -> None:
+        "Cache section geometry arrays that are known to match the sections"
+        for array in (radii, chords, twists):
+            array.setflags(write=False)
+        self._section_cache = (self.sections, radii, chords, twists)
+
+    def _section_arrays(self) -> tuple:
+        "Section geometry as (radii, chords, twists) arrays, one entry per section"
+        cache = self._section_cache
+        if cache is None or cache[0] is not self.sections:
+            self._set_section_arrays(
+                np.array([s.radius for s in self.sections], dtype=float),
+                np.array([s.chord for s in self.sections], dtype=float),
+                np.array([s.twist for s in self.sections], dtype=float))
+            cache = self._section_cache
+        return cache[1:]
+
+    def _airfoil_tables(self) -> tuple:
+        """Airfoil curves resampled onto a uniform alpha grid
 
+        Returns:
+            tuple: (alpha_min, alpha_max, inv_dalpha, cl_lut, cd_lut, cl_alpha_range, cd_alpha_range)
+        """
+        cache = self._airfoil_cache
+        if cache is None or cache[0] is not self.cl_alpha or cache[1] is not self.cd_alpha:
+            # Convert the curves to float64 arrays once, rather than inside every np.interp call
+            cl_x, cl_y = (np.asarray(c, dtype=np.float64) for c in self.cl_alpha)
+            cd_x, cd_y = (np.asarray(c, dtype=np.float64) for c in self.cd_alpha)
+            a_min = min(cl_x[0], cd_x[0])
+            a_max = max(cl_x[-1], cd_x[-1])
+            if a_max > a_min:
+                lut_size = _lut_size(np.union1d(cl_x, cd_x))
+                inv_dalpha = (lut_size - 1) / float(a_max - a_min)
+                alpha_grid = np.linspace(a_min, a_max, lut_size)
+            else:
+                # Every point is at one angle, so np.interp gives a constant coefficient.
+                # A zero grid spacing makes every lookup land on the first entry.
+                for y in (cl_y, cd_y):
+                    if np.ptp(y) > 0:
+                        raise ValueError(
+                            f"Airfoil curve has a single angle of attack ({a_min} degree) "
+                            "but several coefficient values")
+                inv_dalpha = 0.0
+                alpha_grid = np.full(2, a_min)
+            cl_lut = np.interp(alpha_grid, cl_x, cl_y)
+            cd_lut = np.interp(alpha_grid, cd_x, cd_y)
+            cl_lut.setflags(write=False)
+            cd_lut.setflags(write=False)
+            cache = (self.cl_alpha, self.cd_alpha, float(a_min), float(a_max),
+                     inv_dalpha, cl_lut, cd_lut,
+                     (float(cl_x[0]), float(cl_x[-1])), (float(cd_x[0]), float(cd_x[-1])))
+            self._airfoil_cache = cache
+        return cache[2:]
+
+    @property
+    def radii(self) -> np.ndarray:
+        "Radial position of each section (m)"
+        return self._section_arrays()[0]
+
+    @property
+    def chords(self) -> np.ndarray:
+        "Chord length of each section (m)"
+        return self._section_arrays()[1]
+
+    @property
+    def twists(self) -> np.ndarray:
+        "Geometric twist of each section (degree)"
+        return self._section_arrays()[2]
+
+    @property
+    def alpha_min(self) -> float:
+        "First angle of attack in the lookup grid (degree)"
+        return self._airfoil_tables()[0]
+
+    @property
+    def alpha_max(self) -> float:
+        "Last angle of attack in the lookup grid (degree)"
+        return self._airfoil_tables()[1]
+
+    @property
+    def inv_dalpha(self) -> float:
+        "Inverse spacing of the lookup grid (1/degree)"
+        return self._airfoil_tables()[2]
+
+    @property
+    def cl_lut(self) -> np.ndarray:
+        "Lift coefficient on the lookup grid"
+        return self._airfoil_tables()[3]
+
+    @property
+    def cd_lut(self) -> np.ndarray:
+        "Drag coefficient on the lookup grid"
+        return self._airfoil_tables()[4]
+
+    @property
+    def cl_alpha_range(self) -> Tuple[float, float]:
+        "First and last angle of attack in the lift curve (degree)"
+        return self._airfoil_tables()[5]
+
+    @property
+    def cd_alpha_range(self) -> Tuple[float, float]:
+        "First and last angle of attack in the drag curve (degree)"
+        return self._airfoil_tables()[6]
 
 def create_prop(
         num_blades: int, 
@@ -37,23 +171,20 @@ def create_prop(
     chord_lengths = np.linspace(chord_range[0], chord_range[1], num_sections)
     twist_angles = np.linspace(twist_range[0], twist_range[1], num_sections)
 
-    sections = []
-
-    for radius, chord, twist_angle, in zip(r_positions, chord_lengths, twist_angles):
-        blade = BladeSection(
-            radius=radius, 
-            chord=chord, 
-            twist=twist_angle,
-            cl_alpha=cl_alpha,
-            cd_alpha=cd_alpha)
-        
-        sections.append(blade)
+    # The linspace outputs are already valid floats, so skip per-section validation
+    sections = tuple(
+        BladeSection.model_construct(radius=radius, chord=chord, twist=twist_angle)
+        for radius, chord, twist_angle in zip(r_positions.tolist(), chord_lengths.tolist(), twist_angles.tolist())
+    )
         
     prop = Propeller(
         num_blades=num_blades,
         diameter=diameter,
         hub_radius=hub_radius,
-        sections=sections
+        sections=sections,
+        cl_alpha=cl_alpha,
+        cd_alpha=cd_alpha,
         )
+    prop._set_section_arrays(r_positions, chord_lengths, twist_angles)
     
-    return prop
\ No newline at end of file
+    return prop
@@ -1,4 +1,5 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -20,16 +21,37 @@ class SimplifiedMissionScoreModel:
         }
         self.payload_weight = payload_weight
 
+        # Multipliers as arrays indexed by segment position, for scoring many segments at once
+        self.segment_index = {segment: i for i, segment in enumerate(self.autonomous_multipliers)}
+        self.auto_mult = np.array([self.autonomous_multipliers[s] for s in self.segment_index], dtype=float)
+        self.manual_mult = np.array([self.manual_multipliers[s] for s in self.segment_index], dtype=float)
+
     def calculate_segment_score(self, segment, is_autonomous):
         if is_autonomous:
             return self.autonomous_multipliers[segment] * self.payload_weight + 1
         else:
             return self.manual_multipliers[segment] * self.payload_weight + 1
 
+    def calculate_segment_scores(self, segments):
+        idx = np.array([self.segment_index[segment] for segment, _ in segments], dtype=np.intp)
+        is_auto_mask = np.array([is_autonomous for _, is_autonomous in segments], dtype=bool)
+        multipliers = np.where(is_auto_mask, self.auto_mult[idx], self.manual_mult[idx])
+        return multipliers * self.payload_weight + 1
+
     def calculate_mission_score(self, segments, time_bonus):
-        segment_score = sum(self.calculate_segment_score(segment, is_autonomous) 
-                            for segment, is_autonomous in segments)
-        return segment_score + time_bonus
+        if not segments:
+            return float(time_bonus), []
+        segment_scores = self.calculate_segment_scores(segments)
+        return float(segment_scores.sum()) + time_bonus, segment_scores.tolist()
+
+@st.cache_resource
+def get_model(payload_weight):
+    return SimplifiedMissionScoreModel(payload_weight=payload_weight)
+
+@st.cache_data
+def get_mission_score(segments, time_bonus, payload_weight):
+    # segments is a tuple of (segment, is_autonomous) pairs so it can be hashed
+    return get_model(payload_weight).calculate_mission_score(segments, time_bonus)
 
 def main():
     st.set_page_config(layout="wide")
@@ -116,8 +138,7 @@ def main():
         st.header("Mission Results")
 
         # Calculate score
-        model = SimplifiedMissionScoreModel(payload_weight=payload_weight)
-        score = model.calculate_mission_score(selected_segments, time_bonus)
+        score, segment_scores = get_mission_score(tuple(selected_segments), time_bonus, payload_weight)
 
         # Display score
         st.markdown(f"<h2 style='text-align: center;'>Total Mission Score: {score:.2f}</h2>", unsafe_allow_html=True)
@@ -127,8 +148,7 @@ def main():
             st.markdown("<div class='results-card'>", unsafe_allow_html=True)
             
             st.subheader("Segment Breakdown")
-            for segment, is_autonomous in selected_segments:
-                segment_score = model.calculate_segment_score(segment, is_autonomous)
+            for (segment, is_autonomous), segment_score in zip(selected_segments, segment_scores):
                 mode = "Autonomous" if is_autonomous else "Manual"
                 st.write(f"• {segment.replace('_', ' ')} ({mode}): {segment_score:.2f}")
 